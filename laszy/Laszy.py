@@ -1,11 +1,11 @@
 import os
 import re
 import io
-import sys
 import glob
 import uuid
 import math
 import json
+import struct
 import tqdm
 import laspy
 import datetime
@@ -47,6 +47,43 @@ POINT_FILTER_TYPE = PointFilterType(
     LAST_RETURN=0, IGNORE_RETURN=-1, IGNORE_CLASS=-1
 )
 
+# Point record format IDs that carry RGB encoding fields.
+_RGB_POINT_FORMAT_IDS = frozenset((2, 3, 5, 7, 8, 10))
+
+# Files below this size decompress faster single-threaded than the parallel
+# backend takes to spawn its worker threads.
+_PARALLEL_BACKEND_MIN_BYTES = 50 * 1024 * 1024
+
+# laspy names the variable length portion of the VLR differently for each
+# known VLR type. Map the types to their data attribute so lookup is an O(1)
+# type dispatch instead of a per-record __dict__ scan.
+_VLR_DATA_ATTR = {
+    laspy.vlrs.known.WktCoordinateSystemVlr: "string",
+    laspy.vlrs.known.GeoAsciiParamsVlr: "strings",
+    laspy.vlrs.known.GeoDoubleParamsVlr: "doubles",
+    laspy.vlrs.known.GeoKeyDirectoryVlr: "geo_keys",
+    laspy.vlrs.known.ExtraBytesVlr: "extra_bytes_structs",
+    laspy.vlrs.known.ClassificationLookupVlr: "lookups",
+}
+
+
+def _minmax(values) -> tuple:
+
+    """
+    Reduce an array-like to its (min, max) pair.
+
+    Materializes laspy dimension views into a contiguous ndarray once so
+    both reductions run over the same buffer instead of re-driving the
+    view machinery for each of np.min and np.max.
+
+    :param values: Array-like of numeric values.
+    :return: Tuple -> (min, max)
+    """
+
+    arr = np.asarray(values)
+
+    return arr.min(), arr.max()
+
 
 # =========================================================
 # --- Laszy class
@@ -59,44 +96,98 @@ class Laszy:
     Attributes:
         - public_header_block: PublicHeaderBlock object.
         - vlrs: List of VariableLengthRecord objects.
-        - points: Laspy.LasData object (optional) (initialized to None).
+        - points: Point record data (decompressed lazily on first access).
         - evlrs: List of VariableLengthRecord objects.
 
     """
 
-    def __init__(self, file: str, read_points=True):
+    def __init__(self, file: str, read_points=True, laz_backend: laspy.LazBackend = None):
 
         if not self.__is_lidar_file(file):
             raise NotLidarFileError
 
         self.file_basename = os.path.basename(file) if bool(file) else ""
         self.file_absolute = file if bool(file) else ""
-        reader = laspy.read if read_points else laspy.open
+
+        if laz_backend is None:
+            laz_backend = self.__default_laz_backend(file)
 
         try:
-            self._lasdata = reader(file, laz_backend=laspy.LazBackend.LazrsParallel)
+            # laspy.open() only reads the header and VLRs; point decompression
+            # is deferred until the points property is first accessed, so
+            # header/metadata-only consumers never pay for it.
+            self._lasdata = laspy.open(file, laz_backend=laz_backend)
             self.public_header_block = self._lasdata.header
             self.vlrs = self._lasdata.header.vlrs
-            self.points = self._lasdata.points if read_points else None
+            self._points = None
             self.evlrs = self._lasdata.evlrs
         except LazrsError:
             self._lasdata = None
             self.public_header_block = None
             self.vlrs = None
-            self.points = None
+            self._points = None
             self.evlrs = None
 
-    def read_points(self):
+        self._zorder_index = None
+        self._zorder_codes = None
+        self._header_summary = None
+        self._point_summary = None
+
+    @property
+    def points(self):
 
         """
-        Call laspy.read() to get point record data.
+        Point record data, decompressed on first access and cached.
+        """
+
+        if self._points is None and bool(self._lasdata):
+            if isinstance(self._lasdata, laspy.LasReader):
+                self._points = self._lasdata.read_points(self.public_header_block.point_count)
+            else:
+                self._points = self._lasdata.points
+
+        return self._points
+
+    @points.setter
+    def points(self, points):
+        self._points = points
+        self._point_summary = None
+        self._zorder_index = None
+        self._zorder_codes = None
+
+    def read_points(self):
+
         """
+        Read (or re-read) point record data from the start of the file.
 
-        file = self.file_absolute
+        Only meaningful when backed by a LasReader; a LasData object
+        already holds all of its points in memory, so re-reading would
+        only double the work and this is a no-op for it.
+        """
 
-        if bool(file):
+        if isinstance(self._lasdata, laspy.LasReader):
             self._lasdata.seek(0, io.SEEK_SET)
-            self.points = self._lasdata.read_points(self.public_header_block.point_count)
+            self._points = self._lasdata.read_points(self.public_header_block.point_count)
+
+    def read_points_chunk(self, count: int) -> Union[laspy.ScaleAwarePointRecord, None]:
+
+        """
+        Read the next 'count' point records from the current position.
+
+        Enables streaming over files too large to hold in memory: each
+        call decompresses only the requested chunk and advances the
+        reader, so callers can loop until an empty record comes back.
+        The chunk is returned directly and is NOT cached on the points
+        attribute.
+
+        :param count: Number of point records to read.
+        :return: Point record chunk, or None when not backed by a LasReader.
+        """
+
+        if not isinstance(self._lasdata, laspy.LasReader):
+            return None
+
+        return self._lasdata.read_points(count)
 
     def set_lasdata(self, lasdata: Union[laspy.LasReader, laspy.LasData]):
 
@@ -125,8 +216,12 @@ class Laszy:
         self._lasdata = lasdata
         self.public_header_block = self._lasdata.header
         self.vlrs = self._lasdata.header.vlrs
-        self.points = self._lasdata.points if has_points else None
+        self._points = self._lasdata.points if has_points else None
         self.evlrs = self._lasdata.evlrs
+        self._zorder_index = None
+        self._zorder_codes = None
+        self._header_summary = None
+        self._point_summary = None
 
     def get_classes(self) -> list[int]:
 
@@ -136,53 +231,168 @@ class Laszy:
         :return: List of classes present in all point records.
         """
 
-        classes = list(np.unique(self._lasdata.classification))
-        classes = [int(val) for val in classes]
+        # classification is an 8-bit field, so an O(N) 256-bucket bincount
+        # finds the distinct values without sorting the whole array.
+        classification = np.asarray(self.points.classification, dtype=np.uint8)
+        counts = np.bincount(classification, minlength=256)
+        classes = np.nonzero(counts)[0].tolist()
 
         return classes
 
-    def filter_points(self, class_num: int = POINT_FILTER_TYPE.IGNORE_CLASS, return_num: int = POINT_FILTER_TYPE.IGNORE_RETURN) -> Union[laspy.ScaleAwarePointRecord, None]:
+    def filter_points(self, class_num: int = POINT_FILTER_TYPE.IGNORE_CLASS, return_num: int = POINT_FILTER_TYPE.IGNORE_RETURN, bbox: tuple = None) -> Union[laspy.ScaleAwarePointRecord, None]:
 
         """
-        Filter point cloud by return number or class number.
+        Filter point cloud by return number, class number, or spatial bounds.
 
         Returns a numpy ndarray object containing points filtered by input params.
         By default, both class_num and return_num are set to IGNORE.
 
+        When bbox is given, the public header's x/y bounds are used as an O(1)
+        prefilter: a bbox disjoint from the data bounds returns an empty record
+        without scanning points, and a bbox fully containing the data bounds
+        skips the per-point spatial test entirely.
+
         NOTE: return_num=0 indicates LAST_RETURN
         NOTE: return_num=-1 indicates IGNORE
         NOTE: class_num=-1 indicates IGNORE
 
         :param return_num: Integer value indicating return number.
         :param class_num: Integer value indicating class number.
+        :param bbox: Optional (xmin, ymin, xmax, ymax) spatial bounds.
 
         :return: Filtered np.ndarray of points.
         """
 
         filtered = None
-        las = self._lasdata
 
-        if not bool(las):
+        if not bool(self._lasdata):
             return filtered
 
-        return_filter = return_num
+        contains_all = False
+        if bbox is not None:
+            xmin, ymin, xmax, ymax = bbox
+            pub_hdr = self.public_header_block
+            if xmax < pub_hdr.x_min or xmin > pub_hdr.x_max or ymax < pub_hdr.y_min or ymin > pub_hdr.y_max:
+                # build the empty record directly from the header so the
+                # bail-out stays O(1) and never decompresses points.
+                return laspy.ScaleAwarePointRecord.zeros(
+                    0, point_format=pub_hdr.point_format, scales=pub_hdr.scales, offsets=pub_hdr.offsets
+                )
+            if xmin <= pub_hdr.x_min and xmax >= pub_hdr.x_max and ymin <= pub_hdr.y_min and ymax >= pub_hdr.y_max:
+                bbox = None  # bbox adds no constraint, skip the per-point test
+                contains_all = True
+
+        mask = self.__filter_mask(class_num, return_num)
+
+        if bbox is not None:
+            points = self.points
+            x, y = np.asarray(points.x), np.asarray(points.y)
+            spatial = np.asarray(x >= xmin)
+            np.logical_and(spatial, x <= xmax, out=spatial)
+            np.logical_and(spatial, y >= ymin, out=spatial)
+            np.logical_and(spatial, y <= ymax, out=spatial)
+            mask = spatial if mask is None else np.logical_and(mask, spatial, out=spatial)
+
+        if mask is None:
+            # a fully containing bbox with no other filters selects everything
+            return self.points if contains_all else filtered
+
+        filtered = self.points[np.nonzero(mask)[0]]
+
+        return filtered
+
+    def __filter_mask(self, class_num: int, return_num: int) -> Union[np.ndarray, None]:
+
+        """
+        Build the boolean mask selecting points by class/return number.
+
+        :param class_num: Integer value indicating class number.
+        :param return_num: Integer value indicating return number.
+        :return: Boolean mask array, or None when both filters are IGNORE.
+        """
 
         should_filter_return = return_num > POINT_FILTER_TYPE.IGNORE_RETURN
         should_filter_class = class_num > POINT_FILTER_TYPE.IGNORE_CLASS
 
+        # bail out before touching the points property so the IGNORE/IGNORE
+        # case never triggers point decompression.
+        if not (should_filter_class or should_filter_return):
+            return None
+
+        points = self.points
+        return_filter = return_num
+
         if should_filter_return:
-            return_filter = self.points.num_returns if return_num == POINT_FILTER_TYPE.LAST_RETURN else return_num
+            return_filter = points.num_returns if return_num == POINT_FILTER_TYPE.LAST_RETURN else return_num
 
         if should_filter_class and should_filter_return:
-            filtered = las.points[return_filter == las.return_num & las.classification == class_num]
+            # AND the second comparison into the first mask in place so only
+            # two N-byte bool arrays are written instead of three.
+            mask = np.asarray(points.return_num == return_filter)
+            np.logical_and(mask, points.classification == class_num, out=mask)
+            return mask
 
-        elif should_filter_return:
-            filtered = las.points[return_filter == las.return_num]
+        if should_filter_return:
+            return points.return_num == return_filter
 
-        elif should_filter_class:
-            filtered = las.points[las.classification == class_num]
+        if should_filter_class:
+            return points.classification == class_num
 
-        return filtered
+        return None
+
+    def build_zorder_index(self) -> Union[np.ndarray, None]:
+
+        """
+        Build a Z-order (Morton) curve index over the raw x/y coordinates.
+
+        Interleaves the bits of the quantized integer X/Y values into uint64
+        Morton codes and argsorts them once, caching both the codes and the
+        resulting permutation on the instance. Points adjacent along the
+        curve are spatially close, so spatial queries can search code ranges
+        instead of scanning every point. The sort amortizes over repeated
+        queries against the same instance.
+
+        :return: Permutation ordering the points along the Z-order curve, or None if no data was read.
+        """
+
+        if not bool(self._lasdata):
+            return None
+
+        if self._zorder_index is not None:
+            return self._zorder_index
+
+        points = self.points
+        ix = self.__spread_bits(np.asarray(points.X))
+        iy = self.__spread_bits(np.asarray(points.Y))
+        codes = ix | (iy << np.uint64(1))
+
+        self._zorder_codes = codes
+        self._zorder_index = np.argsort(codes)
+
+        return self._zorder_index
+
+    @staticmethod
+    def __spread_bits(values: np.ndarray) -> np.ndarray:
+
+        """
+        Spread 32-bit integer values so every other output bit is zero.
+
+        Shifts signed raw coordinates up to unsigned, then inserts a zero
+        bit between every input bit with the magic-number spread, leaving
+        room to interleave a second coordinate.
+
+        :param values: int32 raw coordinate values.
+        :return: uint64 array with input bits at the even bit positions.
+        """
+
+        v = (values.astype(np.int64) + 2 ** 31).astype(np.uint64)
+        v = (v | (v << np.uint64(16))) & np.uint64(0x0000FFFF0000FFFF)
+        v = (v | (v << np.uint64(8))) & np.uint64(0x00FF00FF00FF00FF)
+        v = (v | (v << np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+        v = (v | (v << np.uint64(2))) & np.uint64(0x3333333333333333)
+        v = (v | (v << np.uint64(1))) & np.uint64(0x5555555555555555)
+
+        return v
 
     def get_density(self, class_num: int = POINT_FILTER_TYPE.IGNORE_CLASS, return_num: int = POINT_FILTER_TYPE.IGNORE_RETURN) -> float:
 
@@ -207,13 +417,17 @@ class Laszy:
 
         density = -1  # return invalid density if failure as a signal something went wrong
 
+        if not bool(self._lasdata):
+            return density
+
         min_x, max_x = self.get_x_minmax()
         min_y, max_y = self.get_y_minmax()
         dim_x, dim_y = max_x - min_x, max_y - min_y
 
-        filtered = self.filter_points(class_num, return_num)
-        if bool(filtered):
-            density = filtered.array.size/(dim_x * dim_y)
+        mask = self.__filter_mask(class_num, return_num)
+        count = self.public_header_block.point_count if mask is None else int(np.count_nonzero(mask))
+        if count > 0:
+            density = count / (dim_x * dim_y)
 
         return density
 
@@ -321,17 +535,15 @@ class Laszy:
         :return: string representing guids 1-4 in hexadecimal encoding.
         """
 
-        pub_hdr = self.public_header_block
-
-        first = pub_hdr.uuid.hex[0:8]
-        second = pub_hdr.uuid.hex[8:12]
-        third = pub_hdr.uuid.hex[12:16]
-        fourth = pub_hdr.uuid.hex[16:20]
-        fifth = pub_hdr.uuid.hex[20:32]
+        raw = self.public_header_block.uuid.bytes
 
-        fourth, fifth = self.__swap_guid_chars(fourth, fifth)
+        # guids 1-3 are stored big-endian here while the two WORDs of
+        # guid 4 are little-endian, so unpack the integers directly
+        # rather than hex-encoding and re-slicing/swapping strings.
+        first, second, third = struct.unpack(">IHH", raw[:8])
+        fourth, fifth_hi = struct.unpack("<HH", raw[8:12])
 
-        return "-".join([first, second, third, fourth, fifth])
+        return f"{first:08x}-{second:04x}-{third:04x}-{fourth:04x}-{fifth_hi:04x}{raw[12:].hex()}"
 
     def get_gps_time_minmax(self) -> tuple:
 
@@ -341,9 +553,7 @@ class Laszy:
         :return: tuple -> (min_time, max_time)
         """
 
-        gps_times = self.points.gps_time
-        gps_min = np.min(gps_times)
-        gps_max = np.max(gps_times)
+        gps_min, gps_max = _minmax(self.points.gps_time)
 
         return float(gps_min), float(gps_max)
 
@@ -355,9 +565,7 @@ class Laszy:
         :return: tuple -> (min_psid, max_psid)
         """
 
-        pt_src_ids = self.points.pt_src_id
-        psid_min = np.min(pt_src_ids)
-        psid_max = np.max(pt_src_ids)
+        psid_min, psid_max = _minmax(self.points.pt_src_id)
 
         return int(psid_min), int(psid_max)
 
@@ -382,22 +590,21 @@ class Laszy:
         point_flags = None
 
         # classification flags only exist for point formats 6-10
-        pdr = self._lasdata.point_format.id
+        pdr = self.public_header_block.point_format.id
         class_flags_exist = (6 <= pdr <= 10)
         if bool(pdr) and not class_flags_exist:
             return point_flags
 
-        class_flags = np.sort(self.points.classification_flags)
-        check_synthetic = np.bitwise_and(class_flags, ASPRS.ClassFlag.SYNTHETIC)
-        check_withheld = np.bitwise_and(class_flags, ASPRS.ClassFlag.WITHHELD)
-        check_keypoint = np.bitwise_and(class_flags, ASPRS.ClassFlag.KEYPOINT)
-        check_overlap = np.bitwise_and(class_flags, ASPRS.ClassFlag.OVERLAP)
-
-        point_flags = {  # check if a flagged point exists after bitwise-and
-            "has_synthetic": ASPRS.ClassFlag.SYNTHETIC in check_synthetic,
-            "has_keypoint": ASPRS.ClassFlag.KEYPOINT in check_keypoint,
-            "has_withheld": ASPRS.ClassFlag.WITHHELD in check_withheld,
-            "has_overlap": ASPRS.ClassFlag.OVERLAP in check_overlap
+        # OR-reduce the flag bytes into a single accumulator: one pass over
+        # the points yields all four flag bits with no temporary arrays.
+        class_flags = np.asarray(self.points.classification_flags)
+        flag_acc = int(np.bitwise_or.reduce(class_flags)) if class_flags.size else 0
+
+        point_flags = {  # check if a flagged point exists anywhere in the records
+            "has_synthetic": bool(flag_acc & ASPRS.ClassFlag.SYNTHETIC),
+            "has_keypoint": bool(flag_acc & ASPRS.ClassFlag.KEYPOINT),
+            "has_withheld": bool(flag_acc & ASPRS.ClassFlag.WITHHELD),
+            "has_overlap": bool(flag_acc & ASPRS.ClassFlag.OVERLAP)
         }
 
         return point_flags
@@ -410,10 +617,9 @@ class Laszy:
         :return: True or False
         """
 
-        rgb_record_ids = [2, 3, 5, 7, 8, 10]
         pid = self.public_header_block.point_format.id
 
-        return pid in rgb_record_ids
+        return pid in _RGB_POINT_FORMAT_IDS
 
     def get_version(self) -> str:
 
@@ -486,7 +692,7 @@ class Laszy:
 
         return False
 
-    def summarize(self, header_only=False, outdir="") -> Union[dict, None]:
+    def summarize(self, header_only=False, outdir="", compact=False) -> Union[dict, None]:
 
         """
         Summarize the input LAS/LAZ data into a dictionary.
@@ -503,37 +709,48 @@ class Laszy:
 
         :param outdir: Out directory. If provided, results will also be writting to a file ({self._file}.json)
         :param header_only: boolean value. Determines whether to read the point data.
+        :param compact: When True, json output is written unindented (faster; meant for batch runs).
         :return:
         """
 
-        point_record_summary = None
         pub_hdr = self.public_header_block
+
+        # the header-derived sections are deterministic on an immutable
+        # _lasdata, so build them once and reuse across repeated calls
+        # (e.g. summarize(header_only=True) followed by a full summarize).
+        if self._header_summary is None:
+            self._header_summary = {
+                "filename": self.file_basename,
+                "public_header_block": self.__public_header_summary(),
+                "crs": self.__crs_info_summary(),
+                "vlrs": {
+                    "vlr_count": len(pub_hdr.vlrs),
+                    "vlr_has_wkt_crs": self.vlrs_have_wkt_crs(),
+                    "vlr_has_geotiff_crs": self.vlrs_have_geotiff_crs(),
+                    "records": self.__vlr_summary()
+                },
+                "point_records": None,
+                "evlrs": {
+                    "evlr_count": pub_hdr.number_of_evlrs,
+                    "evlr_has_wkt_crs": self.vlrs_have_wkt_crs(evlr=True),
+                    "evlr_has_geotiff_crs": self.vlrs_have_geotiff_crs(evlr=True),
+                    "records": self.__vlr_summary(evlr=True)
+                },
+                "rgb_encoding": self.is_rgb_encoded(),
+                "wkt_bbox": self.get_wkt_boundingbox()
+            }
+
+        point_record_summary = None
         if not header_only and pub_hdr.point_count > 0:
-            point_record_summary = self.__point_record_summary()
-
-        summary = {
-            "filename": self.file_basename,
-            "public_header_block": self.__public_header_summary(),
-            "crs": self.__crs_info_summary(),
-            "vlrs": {
-                "vlr_count": len(pub_hdr.vlrs),
-                "vlr_has_wkt_crs": self.vlrs_have_wkt_crs(),
-                "vlr_has_geotiff_crs": self.vlrs_have_geotiff_crs(),
-                "records": self.__vlr_summary()
-            },
-            "point_records": point_record_summary,
-            "evlrs": {
-                "evlr_count": pub_hdr.number_of_evlrs,
-                "evlr_has_wkt_crs": self.vlrs_have_wkt_crs(evlr=True),
-                "evlr_has_geotiff_crs": self.vlrs_have_geotiff_crs(evlr=True),
-                "records": self.__vlr_summary(evlr=True)
-            },
-            "rgb_encoding": self.is_rgb_encoded(),
-            "wkt_bbox": self.get_wkt_boundingbox()
-        }
+            if self._point_summary is None:
+                self._point_summary = self.__point_record_summary()
+            point_record_summary = self._point_summary
+
+        summary = dict(self._header_summary)
+        summary["point_records"] = point_record_summary
 
         if bool(outdir):
-            self.__summary_to_json(outdir, summary)
+            self.__summary_to_json(outdir, summary, compact)
 
         return summary
 
@@ -549,9 +766,13 @@ class Laszy:
         x_min, x_max = self.get_x_minmax()
         y_min, y_max = self.get_y_minmax()
         z_min, z_max = self.get_z_minmax()
-        x_dec_places = str(pub_hdr.x_scale)[::-1].find('.')
-        y_dec_places = str(pub_hdr.y_scale)[::-1].find('.')
-        z_dec_places = str(pub_hdr.z_scale)[::-1].find('.')
+
+        # bind the laspy header properties once; each access runs Python-level
+        # property code, and the scales are needed twice below.
+        x_scale, y_scale, z_scale = pub_hdr.x_scale, pub_hdr.y_scale, pub_hdr.z_scale
+        x_dec_places = max(0, -int(math.floor(math.log10(x_scale))))
+        y_dec_places = max(0, -int(math.floor(math.log10(y_scale))))
+        z_dec_places = max(0, -int(math.floor(math.log10(z_scale))))
 
         pub_hdr_summary = {
             "global_encoding": self.get_global_encoding(),
@@ -570,9 +791,9 @@ class Laszy:
             "y_max": round(y_max, y_dec_places),
             "z_min": round(z_min, z_dec_places),
             "z_max": round(z_max, z_dec_places),
-            "x_scale": pub_hdr.x_scale,
-            "y_scale": pub_hdr.y_scale,
-            "z_scale": pub_hdr.z_scale,
+            "x_scale": x_scale,
+            "y_scale": y_scale,
+            "z_scale": z_scale,
             "x_offset": round(pub_hdr.x_offset, x_dec_places),
             "y_offset": round(pub_hdr.y_offset, y_dec_places),
             "z_offset": round(pub_hdr.z_offset, z_dec_places),
@@ -634,15 +855,13 @@ class Laszy:
         for record in records:
 
             vlr_num = len(record_summaries) + 1
-            vlr_keys = record.__dict__.keys()
             is_copc_info = self.__is_copc_info_vlr(record)
             is_copc_hierarchy = self.__is_copc_hierarchy_vlr(record)
-            # laspy names the variable length portion of the VLR differently for each type of VLR.
-            # Due to this distasteful decision, we must dynamically assign the variable record data
-            # based on each VLR type.
+
             record_data = ""
-            if "record_data" in vlr_keys:
-                record_data = record.record_data
+            data_attr = _VLR_DATA_ATTR.get(type(record))
+            if data_attr is not None:
+                record_data = getattr(record, data_attr)
 
             elif is_copc_info:
                 record_data = b""  # COPC VLRs are a special case (annoying). Ignore them.
@@ -650,8 +869,12 @@ class Laszy:
             elif is_copc_hierarchy:
                 record_data = record.bytes  # COPC VLRs are a special case (annoying). Ignore them.
 
+            elif hasattr(record, "record_data"):
+                record_data = record.record_data
+
             else:
-                for key in vlr_keys:
+                # unknown laspy VLR type: fall back to scanning for a data attribute
+                for key in record.__dict__.keys():
                     if (not key.startswith("_")) and (key not in ["description", "record_id", "user_id"]):
                         record_data = record.__dict__[key]
                         break
@@ -659,7 +882,7 @@ class Laszy:
             summary = {
                 f"vlr{vlr_num}_user_id": record.user_id if not is_copc_hierarchy else None,
                 f"vlr{vlr_num}_record_id": record.record_id if not is_copc_hierarchy else None,
-                f"vlr{vlr_num}_record_length": sys.getsizeof(record_data) if not is_copc_hierarchy else None,
+                f"vlr{vlr_num}_record_length": (len(record_data) if hasattr(record_data, "__len__") else 0) if not is_copc_hierarchy else None,
                 f"vlr{vlr_num}_description": record.description,
                 f"vlr{vlr_num}_record_data": str(record_data) if not isinstance(record_data, bytes) else None
             }
@@ -678,21 +901,25 @@ class Laszy:
 
         return guid_asc
 
-    def __summary_to_json(self, outdir, summary):
+    def __summary_to_json(self, outdir, summary, compact=False):
 
         """
         Private method to encapsulate writing summary dict to json file.
 
         :param outdir: Out directory.
         :param summary: Summary dictionary.
+        :param compact: When True, write unindented json (stays on the C encoder fast path).
         """
 
         os.makedirs(outdir, exist_ok=True)
         file_no_ext = os.path.splitext(self.file_basename)[0]
         out_json = os.path.join(outdir, file_no_ext + ".json")
         if not os.path.exists(out_json):
-            with open(out_json, "w") as outfile:
-                json.dump(summary, outfile, indent=4)
+            with open(out_json, "w", buffering=1 << 20) as outfile:
+                if compact:
+                    json.dump(summary, outfile, separators=(",", ":"))
+                else:
+                    json.dump(summary, outfile, indent=4)
 
     @staticmethod
     def __format_creation_date(pub_hdr: laspy.LasHeader) -> str:
@@ -707,9 +934,7 @@ class Laszy:
         creation_date_fmt = ""
         creation_date = pub_hdr.creation_date
         if creation_date:
-            creation_month = f"{creation_date.month}" if len(str(creation_date.month)) > 1 else f"0{creation_date.month}"
-            creation_day = f"{creation_date.day}" if len(str(creation_date.day)) > 1 else f"0{creation_date.day}"
-            creation_date_fmt = f"{creation_date.year}-{creation_month}-{creation_day}"
+            creation_date_fmt = f"{creation_date.year}-{creation_date.month:02d}-{creation_date.day:02d}"
         return creation_date_fmt
 
     @staticmethod
@@ -722,8 +947,9 @@ class Laszy:
         :return: True or False
         """
 
-        gpst_no_dec = str(gps_time).split(".")[0]
-        return len(gpst_no_dec) <= GPS_WEEK_TIME_LENGTH
+        # adjusted standard gps times are negative before September 2011;
+        # only small non-negative values indicate week time.
+        return 0 <= gps_time < 10 ** GPS_WEEK_TIME_LENGTH
 
     @staticmethod
     def __is_lidar_file(file):
@@ -732,17 +958,32 @@ class Laszy:
         Determine if filename is LAS/LAZ file.
         """
 
-        return file.endswith("las") or file.endswith("laz")
+        return file.lower().endswith((".las", ".laz"))
 
     @staticmethod
-    def __swap_guid_chars(fourth: str, fifth: str):
+    def __default_laz_backend(file: str) -> laspy.LazBackend:
+
+        """
+        Pick a laz backend suited to the input file.
+
+        Small files finish faster single-threaded than they take to spawn
+        decompression threads, and batch runs (e.g. a process-pool
+        LaszyReport) oversubscribe cores if every worker goes parallel, so
+        the parallel backend is reserved for large files. Setting the
+        LASZY_SINGLE_THREAD environment variable forces the
+        single-threaded backend regardless of size.
+
+        :param file: Path to the input LAS/LAZ file.
+        :return: laspy.LazBackend member.
+        """
+
+        if os.environ.get("LASZY_SINGLE_THREAD"):
+            return laspy.LazBackend.Lazrs
 
-        strings = ["", ""]
-        for i, string in enumerate([fourth, fifth]):
-            strings[i] += (string[2:4] + string[0:2])
-        strings[1] += fifth[4:]
+        if os.path.getsize(file) < _PARALLEL_BACKEND_MIN_BYTES:
+            return laspy.LazBackend.Lazrs
 
-        return strings[0], strings[1]
+        return laspy.LazBackend.LazrsParallel
 
     @staticmethod
     def __is_copc_vlr(record):
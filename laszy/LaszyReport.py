@@ -1,11 +1,18 @@
 import os
 import re
-import glob
 import json
+import shutil
 import tqdm
-import math
-import datetime
+import laspy
+import operator
+import itertools
 import pandas as pd
+import concurrent.futures
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+    orjson = None
 
 import Laszy
 from rsge_toolbox.lidar.lidar_const import RegexLidar
@@ -16,6 +23,8 @@ from rsge_toolbox.lidar.lidar_const import RegexLidar
 # ------------------------------------
 CORRUPT_FILE_MSG = "POSSIBLE CORRUPT FILE (Failed to decompress)"
 ACQUISITON = False  # !!! Temporary constant - will be removed in the future. Being used to switch off some features.
+_CONTRACT_RE = re.compile(RegexLidar.CONTRACT_NUMBER)  # precompiled once; compiling per row is wasteful
+_SYSID_RE = re.compile(RegexLidar.SYSTEM_ID_PRODUCTION)
 LASZY_REPORT_DROP_COLUMNS = [  # drop all columns that don't need to be checked for issues
     "x_min", "x_max", "y_min", "y_max", "z_min", "z_max", "guid_hex", "generating_software", "point_count",
     'waveform_internal_packets', 'waveform_external_packets', 'projection', 'spheroid', "wkt_bbox",
@@ -24,6 +33,31 @@ LASZY_REPORT_DROP_COLUMNS = [  # drop all columns that don't need to be checked
 ]
 
 
+def _summarize_one(file: str, json_outdir: str) -> tuple:
+
+    """
+    Summarize a single LAS/LAZ file.
+
+    Module-level worker function so it can be pickled and dispatched
+    to a ProcessPoolExecutor by LaszyReport.
+
+    :param file: Path to a LAS/LAZ file.
+    :param json_outdir: Out directory for json summaries (empty string disables).
+    :return: Tuple of (file, summary or None, error message or None).
+    """
+
+    # each worker already owns a core, so parallel decompression inside a
+    # worker would oversubscribe -- use the single-threaded backend here.
+    las = Laszy.Laszy(file, laz_backend=laspy.LazBackend.Lazrs)
+    try:
+        summary = las.summarize(outdir=json_outdir, compact=True)
+        return file, summary, None
+
+    except Exception as e:
+        is_possibly_corrupt = (not bool(las.public_header_block))
+        return file, None, (CORRUPT_FILE_MSG if is_possibly_corrupt else str(e))
+
+
 # =========================================================
 # --- LaszyReport class
 # =========================================================
@@ -69,6 +103,40 @@ class _LaszyReportColumns:
         *POINT_RECORDS, *CLASS_FLAGS, *EVLR_HDR, RGB_ENCODING, WKT_BBOX
     ]
 
+    # itemgetters fetch all keys for a column group in one C call
+    PUB_HDR_GET = operator.itemgetter(*PUB_HDR)
+    GLOBAL_ENCODING_GET = operator.itemgetter(*GLOBAL_ENCODING)
+    CRS_GET = operator.itemgetter(*CRS)
+    VLR_HDR_GET = operator.itemgetter(*VLR_HDR)
+    POINT_RECORDS_GET = operator.itemgetter(*POINT_RECORDS)
+    CLASS_FLAGS_GET = operator.itemgetter(*CLASS_FLAGS)
+    EVLR_HDR_GET = operator.itemgetter(*EVLR_HDR)
+
+
+LASZY_REPORT_KEEP_COLUMNS = [  # columns actually read back for validation (projection pushdown)
+    column for column in _LaszyReportColumns.COLUMNS
+    if column not in set(LASZY_REPORT_DROP_COLUMNS)
+]
+LASZY_REPORT_VALIDATION_DTYPES = {  # typed columns keep the validation masks on numeric/boolean fast paths
+    "global_encoding": "Int32",
+    "gps_standard_time": "boolean",
+    "wkt_crs": "boolean",
+    "synthetic_returns": "boolean",
+    "has_synthetic": "boolean",
+    "vlr_has_wkt_crs": "boolean",
+    "evlr_has_wkt_crs": "boolean",
+    "version": "float64",
+    "point_data_format": "Int8",
+    "x_scale": "float64",
+    "y_scale": "float64",
+    "z_scale": "float64",
+    "x_offset": "float64",
+    "y_offset": "float64",
+    "z_offset": "float64",
+    "flightline_start": "Int64",
+    "gps_time_min": "float64",
+}
+
 
 class LaszyReport:
 
@@ -91,7 +159,9 @@ class LaszyReport:
         :param verbose: When 'True', display information about progress to the user.
         """
 
+        self._df = None
         self._path = ""
+        self._rows = []
         self._errors = []
         self.outdir = odir
         self.verbose = verbose
@@ -102,23 +172,29 @@ class LaszyReport:
         self._DEFAULT_NAME = "laszy_report.csv"
         self._JSON_LOG_NAME = "json_completed.log"
         self._LIDAR_LOG_NAME = "lidar_completed.log"
-        self.json_list = [f for f in flist if f.endswith('json')]
-        self.lidar_list = [f for f in flist if (f.endswith("laz") or f.endswith("las"))]
+        self.json_list = []
+        self.lidar_list = []
+        for file in flist:  # partition json/lidar inputs in a single pass
+            if file.endswith("json"):
+                self.json_list.append(file)
+            elif file.endswith("laz") or file.endswith("las"):
+                self.lidar_list.append(file)
         self.__remove_processed_lidar()
 
     def __remove_processed_lidar(self):
         laszy_json = os.path.join(self.outdir, "laszy_json")
+        processed = {os.path.basename(json_file).rsplit(".", 1)[0] for json_file in self.json_list}
         if os.path.exists(laszy_json):
-            self.json_list.extend(
-                glob.glob(os.path.join(laszy_json, "*.json"))
-            )
-
-        laszy_json_bases = [os.path.basename(json_file) for json_file in self.json_list]
-        for lidar_file in self.lidar_list.copy():
-            lidar_base = os.path.basename(lidar_file)
-            lidar_json = lidar_base.split(".")[0] + ".json"
-            if lidar_json in laszy_json_bases:
-                self.lidar_list.remove(lidar_file)
+            with os.scandir(laszy_json) as entries:  # scandir beats glob; DirEntry caches name
+                for entry in entries:
+                    if entry.name.endswith(".json"):
+                        self.json_list.append(entry.path)
+                        processed.add(entry.name.rsplit(".", 1)[0])
+
+        self.lidar_list = [
+            lidar_file for lidar_file in self.lidar_list
+            if os.path.basename(lidar_file).rsplit(".", 1)[0] not in processed
+        ]
 
     def write(self, name: str = "", validate=False, check_logs: bool = True):
 
@@ -133,19 +209,19 @@ class LaszyReport:
         :param name: Output filename (default='laszy_report.csv')
         """
 
-        existing_data = ""
         if not bool(name):
             name = self._DEFAULT_NAME
 
         if not name.endswith(".csv"):
             name += ".csv"
 
+        inherit = False
         self._path = os.path.join(self.outdir, name)
         if check_logs:
-            existing_data = self.__check_logs(existing_data, self._path)
+            inherit = self.__check_logs(self._path)
 
-        with open(self._path, "w") as csv:
-            self.__write_report(csv, existing_data)
+        with open(self._path, "a" if inherit else "w") as csv:
+            self.__write_report(csv, inherit)
 
         if validate:
             self.validate_report()
@@ -160,18 +236,20 @@ class LaszyReport:
         if not bool(path):
             path = self._path
 
-        if os.path.exists(path):
-            issues = {}
-            df = pd.read_csv(path)
+        if self._df is not None and path == self._path:
+            df = self._df[LASZY_REPORT_KEEP_COLUMNS].copy()
+            # in-memory rows carry the raw "N/A" class-flag placeholder
+            df['has_synthetic'] = df['has_synthetic'].replace("N/A", pd.NA)
+        elif os.path.exists(path):
+            df = pd.read_csv(path, usecols=LASZY_REPORT_KEEP_COLUMNS)
+        else:
+            df = None
 
-            df = df.drop(LASZY_REPORT_DROP_COLUMNS, axis=1)
+        if df is not None:
+            issues = {}
+            df = df.astype(LASZY_REPORT_VALIDATION_DTYPES)
 
-            df = self.__public_header_check(df, issues)
-            df = self.__xyx_scale_check(df, issues)
-            df = self.__xyz_offset_check(df, issues)
-            df = self.__global_encoding_check(df, issues)
-            df = self.__crs_check(df, issues)
-            df = self.__point_records_check(df, issues)
+            df = self.__validation_sweep(df, issues)
 
             if bool(issues):
                 issues = {key: int(issues[key]) for key, value in issues.items()}
@@ -181,46 +259,62 @@ class LaszyReport:
 
                 # write the json summary
                 out_summary_name = name_no_ext + "_errors_summary.json"
-                with open(os.path.join(_outdir, out_summary_name), "w") as json_summary:
-                    json.dump(issues, json_summary, indent=4)
+                if orjson:
+                    with open(os.path.join(_outdir, out_summary_name), "wb") as json_summary:
+                        json_summary.write(orjson.dumps(issues, option=orjson.OPT_INDENT_2))
+                else:
+                    with open(os.path.join(_outdir, out_summary_name), "w") as json_summary:
+                        json.dump(issues, json_summary, indent=4)
 
                 # write the errors file
                 out_csv_name = os.path.join(_outdir, name_no_ext + "_errors.csv")
                 df.to_csv(out_csv_name)
 
-    def __write_report(self, csv, existing_data):
+    def __write_report(self, csv, inherit: bool):
 
         """
         Write final CSV report.
 
-        Private helper method.
+        Private helper method. Accumulates one row dictionary per input
+        file and serializes them in a single pandas to_csv() call, which
+        also handles quoting/escaping of embedded separators.
 
         :param csv: Open csv file-like object.
-        :param existing_data: Previous CSV data.
+        :param inherit: When True, rows are appended below an existing report.
         """
 
-        if bool(existing_data):
-            csv.write(existing_data)
-        else:
-            csv.write(",".join(_LaszyReportColumns.COLUMNS) + "\n")
-        self.__from_lidar_list(csv)
-        self.__from_json_list(csv)
+        self.__from_lidar_list()
+        self.__from_json_list()
 
-    def __check_logs(self, existing_data, out):
+        df = pd.DataFrame(self._rows, columns=_LaszyReportColumns.COLUMNS)
+        df.to_csv(csv, index=False, header=not inherit)
+
+        # keep the frame around so validate_report() can skip re-reading the csv.
+        # inherited rows from a previous report only exist on disk, so fall back
+        # to the file in that case.
+        self._df = df if not inherit else None
+
+    def __check_logs(self, out) -> bool:
 
         """
         Check existing log files and inherit data from previous reports (if possible).
 
-        :param existing_data: existing data from previous csv file.
-        :param out: out directory.
+        Rather than reading the previous report into memory, the existing
+        file is backed up with shutil.copyfile (zero-copy at the kernel
+        level where supported) and new rows are appended to it in place.
+
+        :param out: Path to the output report.
+        :return: True when a previous report exists and should be appended to.
         """
 
         for is_lidar in [False, True]:
             self.__check_for_completed(lidar=is_lidar)
+
         if os.path.exists(out):
-            with open(out, "r") as f:
-                existing_data = f.read()
-        return existing_data
+            shutil.copyfile(out, out + ".bak")
+            return True
+
+        return False
 
     def __log_completed(self, lidar: bool = False):
 
@@ -235,8 +329,7 @@ class LaszyReport:
 
         if bool(completed):
             with open(os.path.join(self.outdir, out_name), "w") as f:
-                for file in completed:
-                    f.write(file + "\n")
+                f.write("\n".join(completed) + "\n")
 
     def __write_err(self, out):
 
@@ -248,52 +341,49 @@ class LaszyReport:
 
         if bool(self._errors):
             with open(f"{out}_exceptions.log", "w") as err_log:
-                for err in self._errors:
-                    fname = err[0]
-                    exception = err[1]
-                    err_log.write(fname + f"\n\t{exception}\n")
+                err_log.write(
+                    "".join(f"{fname}\n\t{exception}\n" for fname, exception in self._errors)
+                )
 
-    def __from_lidar_list(self, csv):
+    def __from_lidar_list(self):
 
         """
-        Write rows ro open CSV file from list of lidar files (LAS/LAZ).
-
-        :param csv: Open file pointer to CSV file object.
+        Collect report rows from list of lidar files (LAS/LAZ).
         """
 
         if bool(self.lidar_list):
             json_outdir = os.path.join(self.outdir, "laszy_json") if self.las_to_json else ""
-            files = tqdm.tqdm(self.lidar_list, desc="Processing LAS/LAZ files...") if self.verbose else self.lidar_list
-            for file in files:
-                las = Laszy.Laszy(file)
-                try:
-                    s = las.summarize(outdir=json_outdir)
-                    row = self.__get_row(s)
-                    csv.write(",".join(row) + "\n")
-                    self._lidar_completed.append(file)
-
-                except Exception as e:
-                    is_possibly_corrupt = (not bool(las.public_header_block))
-                    self._errors.append(
-                        (file, (CORRUPT_FILE_MSG if is_possibly_corrupt else e) + "\n")
-                    )
-
-    def __from_json_list(self, csv):
+            with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                results = executor.map(
+                    _summarize_one, self.lidar_list, itertools.repeat(json_outdir), chunksize=4
+                )
+                if self.verbose:
+                    results = tqdm.tqdm(results, total=len(self.lidar_list), desc="Processing LAS/LAZ files...")
+                for file, summary, error in results:
+                    if error is not None:
+                        self._errors.append((file, error + "\n"))
+                        continue
+
+                    try:
+                        self._rows.append(self.__get_row(summary))
+                        self._lidar_completed.append(file)
+
+                    except Exception as e:
+                        self._errors.append((file, e))
+
+    def __from_json_list(self):
 
         """
-        Write rows to CSV file from list of json files.
-
-        :param csv: Open file pointer to CSV file object.
+        Collect report rows from list of json files.
         """
 
         if bool(self.json_list):
             files = tqdm.tqdm(self.json_list, desc="Processing JSON files...") if self.verbose else self.json_list
             for file in files:
                 try:
-                    with open(file, "r") as f:
-                        summary = json.load(f)
-                        row = self.__get_row(summary)
-                        csv.write(",".join(row) + "\n")
+                    with open(file, "rb") as f:
+                        summary = orjson.loads(f.read()) if orjson else json.loads(f.read())
+                        self._rows.append(self.__get_row(summary))
                     self._json_completed.append(file)
 
                 except Exception as e:
@@ -317,283 +407,159 @@ class LaszyReport:
         :param lidar: When True, will check lidar logs, otherwise, will check json logs.
         """
 
-        file_list = self.lidar_list if lidar else self.json_list
         log_name = self._LIDAR_LOG_NAME if lidar else self._JSON_LOG_NAME
 
-        log = os.path.join(self.outdir, log_name)
-        if os.path.exists(log):
-            with open(log, "r") as f:
-                contents = f.read()
-                ignore_list = contents.split("\n")
-
-            set_ignore = set(ignore_list)
-            set_file_list = set(file_list)
-            file_list_ = list(set_file_list.difference(set_ignore))
-
+        ignore = self.__load_log(os.path.join(self.outdir, log_name))
+        if bool(ignore):
             if lidar:
-                self.lidar_list = file_list_
+                self.lidar_list = list(set(self.lidar_list) - ignore)
             else:
-                self.json_list = file_list_
+                self.json_list = list(set(self.json_list) - ignore)
+
+    @staticmethod
+    def __load_log(path: str) -> set:
+
+        """
+        Read a completed log file into a set of filenames.
+
+        :param path: Path to a completed log file.
+        :return: Set of logged filenames (empty when no log exists).
+        """
+
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                return set(f.read().splitlines())
+
+        return set()
 
     @staticmethod
-    def __get_row(summary: dict) -> list[str]:
+    def __get_row(summary: dict) -> dict:
 
         """
         Get a single row for output csv.
 
         Uses the keys stored in enum class '_LaszyReportColumns' to
         retrieve the values stored in a json dictionary that represents
-        a Laszy summary and casts all values to a string.
+        a Laszy summary. Values are kept native; the CSV serializer
+        stringifies and quotes them on write.
 
         :param summary: Dictionary object containing laszy summary data.
-        :return: List of strings containing each values in laszy summary.
+        :return: Dictionary keyed by _LaszyReportColumns.COLUMNS.
         """
 
         pr = summary["point_records"]
         phb = summary["public_header_block"]
-        pub_hdr_vals = [str(phb[key]) for key in _LaszyReportColumns.PUB_HDR]
-        ge_vals = [str(phb["global_encoding"][key]) for key in _LaszyReportColumns.GLOBAL_ENCODING]
-        crs_vals = [str(summary["crs"][key]) for key in _LaszyReportColumns.CRS]
-        vlr_vals = [str(summary["vlrs"][key]) for key in _LaszyReportColumns.VLR_HDR]
-        point_vals = [str(pr[key]) for key in _LaszyReportColumns.POINT_RECORDS]
-        evlr_vals = [str(summary["evlrs"][key]) for key in _LaszyReportColumns.EVLR_HDR]
-
-        flag_vals = [
-            (str(pr["class_flags"][key]) if bool(pr["class_flags"]) else "N/A")
-            for key in _LaszyReportColumns.CLASS_FLAGS
-        ]
+        pub_hdr_vals = _LaszyReportColumns.PUB_HDR_GET(phb)
+        ge_vals = _LaszyReportColumns.GLOBAL_ENCODING_GET(phb["global_encoding"])
+        crs_vals = _LaszyReportColumns.CRS_GET(summary["crs"])
+        vlr_vals = _LaszyReportColumns.VLR_HDR_GET(summary["vlrs"])
+        point_vals = _LaszyReportColumns.POINT_RECORDS_GET(pr)
+        evlr_vals = _LaszyReportColumns.EVLR_HDR_GET(summary["evlrs"])
+
+        class_flags = pr.get("class_flags")
+        flag_vals = (
+            _LaszyReportColumns.CLASS_FLAGS_GET(class_flags) if bool(class_flags)
+            else ["N/A"] * len(_LaszyReportColumns.CLASS_FLAGS)
+        )
 
         row = [
             summary["filename"], *pub_hdr_vals, *ge_vals, *crs_vals,
-            *vlr_vals, *point_vals, *flag_vals, *evlr_vals, str(summary["rgb_encoding"]), summary["wkt_bbox"]
+            *vlr_vals, *point_vals, *flag_vals, *evlr_vals, summary["rgb_encoding"], summary["wkt_bbox"]
         ]
 
-        # make sure to wrap each row item in quotes
-        # if the item contains a csv seperator in it
-        for i in range(len(row)):
-            if row[i].find(",") >= 0:
-                row[i] = f"\"{row[i]}\""
-
-        return row
-
-    @staticmethod
-    def __global_encoding_check(df, issues):
-
-        """Check global encoding value for issues"""
-
-        df['global_encoding'] = df['global_encoding'].apply(LaszyReport.__is_globalencoding_invalid)
-        col = df["global_encoding"] != ""
-        if col.sum() > 0:
-            issues.update({"global_encoding_value": col.sum()})
-        else:
-            df = df.drop("global_encoding", axis=1)
-
-        df['wkt_crs'] = df['wkt_crs'].apply(LaszyReport.__is_wktflag_invalid)
-        col = df["wkt_crs"] != ""
-        if col.sum() > 0:
-            issues.update({"wkt_crs_flag": col.sum()})
-        else:
-            df = df.drop("wkt_crs", axis=1)
-
-        df['gps_standard_time'] = df['gps_standard_time'].apply(LaszyReport.__is_gpstimeflag_invalid)
-        col = df["gps_standard_time"] != ""
-        if col.sum() > 0:
-            issues.update({"gps_time_flag": col.sum()})
-        else:
-            df = df.drop("gps_standard_time", axis=1)
-        # guid contract number check
-        df['synthetic_returns'] = df['synthetic_returns'].apply(LaszyReport.__is_syntheticflag_invalid)
-        col = df["synthetic_returns"] != ""
-        if col.sum() > 0:
-            issues.update({"synthetic_returns_flag": col.sum()})
-        else:
-            df = df.drop("synthetic_returns", axis=1)
-
-        return df
-
-    @staticmethod
-    def __xyz_offset_check(df, issues):
-
-        """Check XYZ offset for issues."""
-
-        df['x_offset'] = df['x_offset'].apply(LaszyReport.__is_xoffset_invalid)
-        col = df["x_offset"] != ""
-        if col.sum() > 0:
-            issues.update({"x_offset": col.sum()})
-        else:
-            df = df.drop("x_offset", axis=1)
-
-        df['y_offset'] = df['y_offset'].apply(LaszyReport.__is_yoffset_invalid)
-        col = df["y_offset"] != ""
-        if col.sum() > 0:
-            issues.update({"y_offset": col.sum()})
-        else:
-            df = df.drop("y_offset", axis=1)
-
-        df['z_offset'] = df['z_offset'].apply(LaszyReport.__is_zoffset_invalid)
-        col = df["z_offset"] != ""
-        if col.sum() > 0:
-            issues.update({"z_offset": col.sum()})
-        else:
-            df = df.drop("z_offset", axis=1)
-
-        return df
-
-    @staticmethod
-    def __xyx_scale_check(df, issues):
-
-        """Check XYZ scaling for issues."""
-
-        # guid contract number check
-        df['x_scale'] = df['x_scale'].apply(LaszyReport.__is_xscale_invalid)
-        col = df["x_scale"] != ""
-        if col.sum() > 0:
-            issues.update({"x_scale": col.sum()})
-        else:
-            df = df.drop("x_scale", axis=1)
-
-        # guid contract number check
-        df['y_scale'] = df['y_scale'].apply(LaszyReport.__is_yscale_invalid)
-        col = df["y_scale"] != ""
-        if col.sum() > 0:
-            issues.update({"y_scale": col.sum()})
-        else:
-            df = df.drop("y_scale", axis=1)
-
-        # guid contract number check
-        df['z_scale'] = df['z_scale'].apply(LaszyReport.__is_zscale_invalid)
-        col = df["z_scale"] != ""
-        if col.sum() > 0:
-            issues.update({"z_scale": col.sum()})
-        else:
-            df = df.drop("z_scale", axis=1)
-
-        return df
+        return dict(zip(_LaszyReportColumns.COLUMNS, row))
 
     @staticmethod
-    def __point_records_check(df, issues):
+    def __column_checks() -> list[tuple]:
 
-        """Check point record fields for any issues with data."""
-
-        # check for class code 0
-        df['classes'] = df['classes'].apply(LaszyReport.__is_neverclassified_points)
-        col = df["classes"] != ""
-        if col.sum() > 0:
-            issues.update({"points_in_never_classified": col.sum()})
-        else:
-            df = df.drop("classes", axis=1)
-
-        # check for invalid flightline numbers
-        df['flightline_start'] = df['flightline_start'].apply(LaszyReport.__is_flightlines_invalid)
-        col = df["flightline_start"] != ""
-        if col.sum() > 0:
-            issues.update({"invalid_flightline_numbers": col.sum()})
-        else:
-            df = df.drop(["flightline_start", "flightline_end"], axis=1)
+        """
+        Declarative table of single-column validation checks.
 
-        # check for invalid gps times
-        df['gps_time_min'] = df['gps_time_min'].apply(LaszyReport.__is_gpsweektime_present)
-        col = df["gps_time_min"] != ""
-        if col.sum() > 0:
-            df = df.drop("gps_time_max", axis=1)
-            issues.update({"gps_week_time_found": col.sum()})
-        else:
-            df = df.drop(["gps_time_min", "gps_time_max"], axis=1)
+        Each entry is (column, flag_fn, issue_key, clean_drop, dirty_drop):
+            - flag_fn maps the column Series to a flagged Series where valid
+              cells become "" and invalid cells keep (or describe) their value.
+            - clean_drop: extra columns dropped when the column is clean.
+            - dirty_drop: extra columns dropped even when issues were found.
 
-        # check for synthetic flags
-        df['has_synthetic'] = df['has_synthetic'].apply(LaszyReport.__is_syntheticclassflag_invalid)
-        col = df["has_synthetic"] != ""
-        if col.sum() > 0:
-            issues.update({"synthetic_class_flags": col.sum()})
-        else:
-            df = df.drop("has_synthetic", axis=1)
+        The masks are computed on the typed Series; the "" sentinel is then
+        written into an object-cast copy, since the nullable extension dtypes
+        reject string fills.
 
-        # check if no wkt crs is present at all
-        df['date_end'] = df['date_end'].apply(LaszyReport.__is_date_from_future)
-        col = df["date_end"] != ""
-        if col.sum() > 0:
-            df["invalid_dates"] = col
-            issues.update({"invalid_dates_found": col.sum()})
-        df = df.drop('date_end', axis=1)
+        :return: List of check tuples consumed by __validation_sweep().
+        """
 
-        return df
+        return [
+            ("guid_asc", LaszyReport.__flag_guid, "guid_contract_number", (), ()),
+            ("system_id", LaszyReport.__flag_system_id, "system_id_format", (), ()),
+            ("version", lambda s: s.astype(object).where(s.ne(1.4), ""), "version", (), ()),
+            ("point_data_format", lambda s: s.astype(object).where(s.ne(6), ""), "point_data_format", (), ()),
+            ("x_scale", lambda s: s.astype(object).where(s.ne(0.01), ""), "x_scale", (), ()),
+            ("y_scale", lambda s: s.astype(object).where(s.ne(0.01), ""), "y_scale", (), ()),
+            ("z_scale", lambda s: s.astype(object).where(s.ne(0.01), ""), "z_scale", (), ()),
+            ("x_offset", lambda s: s.astype(object).where(s.mod(1).ne(0), ""), "x_offset", (), ()),
+            ("y_offset", lambda s: s.astype(object).where(s.mod(1).ne(0), ""), "y_offset", (), ()),
+            ("z_offset", lambda s: s.astype(object).where(s.mod(1).ne(0), ""), "z_offset", (), ()),
+            ("global_encoding", lambda s: s.astype(object).where(s.ne(17), ""), "global_encoding_value", (), ()),
+            ("wkt_crs", lambda s: s.astype(object).where(s.ne(True), ""), "wkt_crs_flag", (), ()),
+            ("gps_standard_time", lambda s: s.astype(object).where(s.ne(True), ""), "gps_time_flag", (), ()),
+            ("synthetic_returns", lambda s: s.astype(object).where(s.ne(False), ""), "synthetic_returns_flag", (), ()),
+            ("compd_cs", LaszyReport.__flag_compd_cs, "compd_cs", (), ()),
+            ("vert_datum", lambda s: s.where(s.ne("Canadian Geodetic Vertical Datum of 2013"), ""), "vert_datum", (), ()),
+            ("hz_datum", lambda s: s.where(s.ne("NAD83_Canadian_Spatial_Reference_System"), ""), "hz_datum", (), ()),
+            ("classes", LaszyReport.__flag_classes, "points_in_never_classified", (), ()),
+            ("flightline_start", lambda s: s.astype(object).where(s.lt(1), ""), "invalid_flightline_numbers", ("flightline_end",), ()),
+            ("gps_time_min", lambda s: s.astype(object).where(s.le(604800), ""), "gps_week_time_found", ("gps_time_max",), ("gps_time_max",)),
+            ("has_synthetic", lambda s: s.astype(object).where(s.fillna(False).ne(False), ""), "synthetic_class_flags", (), ()),
+        ]
 
     @staticmethod
-    def __crs_check(df, issues):
+    def __validation_sweep(df, issues):
 
-        """Check CRS for any issues."""
-
-        # check for existence of compound crs
-        df['compd_cs'] = df['compd_cs'].apply(LaszyReport.__is_compdcs_invalid)
-        col = df["compd_cs"] != ""
-        if col.sum() > 0:
-            issues.update({"compd_cs": col.sum()})
-        else:
-            df = df.drop('compd_cs', axis=1)
+        """
+        Run every column validation check in a single sweep.
+
+        Iterates the declarative table from __column_checks() once,
+        computing one vectorized mask per column. Clean columns are
+        dropped from the error report; dirty columns keep their flagged
+        values and increment the matching issue counter. The two checks
+        that span multiple columns (wkt presence, future dates) and the
+        acquisition-only source id check run after the table.
+
+        :param df: DataFrame holding the report rows.
+        :param issues: Dictionary of issue counts (mutated in place).
+        :return: DataFrame reduced to the columns with issues.
+        """
 
-        # check the vertical datum
-        df['vert_datum'] = df['vert_datum'].apply(LaszyReport.__is_vertdatum_invalid)
-        col = df["vert_datum"] != ""
-        if col.sum() > 0:
-            issues.update({"vert_datum": col.sum()})
-        else:
-            df = df.drop('vert_datum', axis=1)
+        drop_cols = []  # clean columns are dropped in one batch at the end
 
-        # check the horizontal datum
-        df['hz_datum'] = df['hz_datum'].apply(LaszyReport.__is_hzdatum_invalid)
-        col = df["hz_datum"] != ""
-        if col.sum() > 0:
-            issues.update({"hz_datum": col.sum()})
-        else:
-            df = df.drop('hz_datum', axis=1)
+        for column, flag, key, clean_drop, dirty_drop in LaszyReport.__column_checks():
+            flagged = flag(df[column])
+            col = flagged.ne("")
+            if col.sum() > 0:
+                df[column] = flagged
+                issues.update({key: col.sum()})
+                drop_cols.extend(dirty_drop)
+            else:
+                drop_cols.extend([column, *clean_drop])
 
         # check if no wkt crs is present at all
-        df['vlr_has_wkt_crs'] = df['vlr_has_wkt_crs'].apply(LaszyReport.__is_vlrwkt_empty)
-        df['evlr_has_wkt_crs'] = df['evlr_has_wkt_crs'].apply(LaszyReport.__is_vlrwkt_empty)
-        col_vlr = df["vlr_has_wkt_crs"] != ""
-        col_evlr = df["evlr_has_wkt_crs"] != ""
+        col_vlr = df['vlr_has_wkt_crs'].ne(True)
+        col_evlr = df['evlr_has_wkt_crs'].ne(True)
         col = col_vlr & col_evlr
         if ~col.sum() > 0:
             df["no_wkt_found"] = col
             issues.update({"vlr_has_wkt_crs": col.sum()})
-        df = df.drop(['vlr_has_wkt_crs', 'evlr_has_wkt_crs'], axis=1)
-
-        return df
-
-    @staticmethod
-    def __public_header_check(df, issues):
-
-        # guid contract number check
-        df['guid_asc'] = df['guid_asc'].apply(LaszyReport.__is_contract_invalid)
-        col = df["guid_asc"] != ""
-        if col.sum() > 0:
-            issues.update({"guid_contract_number": col.sum()})
-        else:
-            df = df.drop("guid_asc", axis=1)
-
-        # System ID format check
-        df['system_id'] = df['system_id'].apply(LaszyReport.__is_systemid_invalid)
-        col = df["system_id"] != ""
-        if col.sum() > 0:
-            issues.update({"system_id_format": col.sum()})
-        else:
-            df = df.drop("system_id", axis=1)
-
-        # version check
-        df['version'] = df['version'].apply(LaszyReport.__is_lasversion_invalid)
-        col = df["version"] != ""
-        if col.sum() > 0:
-            issues.update({"version": col.sum()})
-        else:
-            df = df.drop("version", axis=1)
+        drop_cols.extend(['vlr_has_wkt_crs', 'evlr_has_wkt_crs'])
 
-        # Point data record format check
-        df['point_data_format'] = df['point_data_format'].apply(LaszyReport.__is_pointformat_invalid)
-        col = df["point_data_format"] != ""
+        # check for dates from the future (or GpsDateConversionError strings)
+        parsed = pd.to_datetime(df['date_end'].astype(str).str.split().str[0], errors='coerce')
+        today = pd.Timestamp.today().normalize()
+        gps_err = df['date_end'].eq(Laszy.GPS_WEEK_TIME_ERR_STR)
+        col = gps_err | (parsed > today)
         if col.sum() > 0:
-            issues.update({"point_data_format": col.sum()})
-        else:
-            df = df.drop("point_data_format", axis=1)
+            df["invalid_dates"] = col
+            issues.update({"invalid_dates_found": col.sum()})
+        drop_cols.append('date_end')
 
         if ACQUISITON:
             # File source id vs filename number check
@@ -602,220 +568,56 @@ class LaszyReport:
             if col.sum() > 0:
                 issues.update({"filename_has_correct_source_id": col.sum()})
             else:
-                df = df.drop("filename_has_correct_source_id", axis=1)
-
-        return df
-
-    @staticmethod
-    def __is_sourceid_valid(row):
-        numb5 = str(row["filename"]).split("_")[0]
-        fsid = str(row["file_source_id"])
-        return "Correct" if fsid == numb5 else "Filename does not contain File Source ID"
-
-    @staticmethod
-    def __is_syntheticclassflag_invalid(synthetic_class_flag: bool):
-        expected = False
-        if not math.isnan(synthetic_class_flag) and synthetic_class_flag != expected:
-            return synthetic_class_flag
-        else:
-            return ""
-
-    @staticmethod
-    def __is_gpsweektime_present(gps_min_time: int):
-        max_gps_week_time = 604800
-        if max_gps_week_time >= gps_min_time:
-            return str(gps_min_time)
-        else:
-            return ""
-
-    @staticmethod
-    def __is_flightlines_invalid(point_source_id: int):
-        min_valid_fl = 1
-        if point_source_id < min_valid_fl:
-            return str(point_source_id)
-        else:
-            return ""
+                drop_cols.append("filename_has_correct_source_id")
 
-    @staticmethod
-    def __is_neverclassified_points(classes: str):
-        expected = 0
-        classes = classes.replace("[", "").replace("]", "")
-        classes = [int(val) for val in classes.split(",")]
-        if expected in classes:
-            return str(classes)
-        else:
-            return ""
+        df.drop(columns=list(dict.fromkeys(drop_cols)), inplace=True)
 
-    @staticmethod
-    def __is_vlrwkt_empty(vlr_has_wkt: bool):
-        expected = True
-        if vlr_has_wkt != expected:
-            return vlr_has_wkt
-        else:
-            return ""
+        return df
 
     @staticmethod
-    def __is_hzdatum_invalid(hz_datum: str):
-        expected = "NAD83_Canadian_Spatial_Reference_System"
-        if hz_datum != expected:
-            return hz_datum
-        else:
-            return ""
+    def __flag_guid(guid_asc):
 
-    @staticmethod
-    def __is_vertdatum_invalid(vert_datum: str):
-        expected = "Canadian Geodetic Vertical Datum of 2013"
-        if vert_datum != expected:
-            return vert_datum
-        else:
-            return ""
+        """Flag guid values missing a valid contract number."""
 
-    @staticmethod
-    def __is_compdcs_invalid(compdcs: str):
-        expected = bool(compdcs)
-        if not expected:
-            return "No compound projection"
-        else:
-            return ""
+        guid = guid_asc.fillna("").astype(str)
+        missing = guid.eq("")
+        nomatch = ~guid.str.contains(_CONTRACT_RE, regex=True) & ~missing
 
-    @staticmethod
-    def __is_contract_invalid(guid: str):
-        expected = re.compile(RegexLidar.CONTRACT_NUMBER)
-        if bool(guid):
-            if (not isinstance(guid, str)) and (not isinstance(guid, bytes)):
-                return "unknown format"
-            elif not bool(expected.search(guid)):
-                return guid
-            else:
-                return ""
-        return "No GUID found"
+        return guid.where(nomatch, "").mask(missing, "No GUID found")
 
     @staticmethod
-    def __is_systemid_invalid(system_id: str):
-        expected = re.compile(RegexLidar.SYSTEM_ID_PRODUCTION)
-        if bool(system_id):
-            if (not isinstance(system_id, str)) and (not isinstance(system_id, bytes)):
-                return "unknown format"
-            elif not bool(expected.search(system_id)):
-                return system_id
-            else:
-                return ""
-        return "No System ID found"
+    def __flag_system_id(system_id):
 
-    @staticmethod
-    def __is_lasversion_invalid(lasversion: float):
-        expected = 1.4
-        if lasversion != expected:
-            return str(lasversion)
-        else:
-            return ""
+        """Flag system id values that don't match the production format."""
 
-    @staticmethod
-    def __is_pointformat_invalid(pointformat: int):
-        expected = 6
-        if pointformat != expected:
-            return str(pointformat)
-        else:
-            return ""
+        sysid = system_id.fillna("").astype(str)
+        missing = sysid.eq("")
+        nomatch = ~sysid.str.contains(_SYSID_RE, regex=True) & ~missing
 
-    @staticmethod
-    def __is_xscale_invalid(xscale: float):
-        expected = 0.01
-        if xscale != expected:
-            return str(xscale)
-        else:
-            return ""
+        return sysid.where(nomatch, "").mask(missing, "No System ID found")
 
     @staticmethod
-    def __is_yscale_invalid(yscale: float):
-        expected = 0.01
-        if yscale != expected:
-            return str(yscale)
-        else:
-            return ""
+    def __flag_compd_cs(compd_cs):
 
-    @staticmethod
-    def __is_zscale_invalid(zscale: float):
-        expected = 0.01
-        if zscale != expected:
-            return str(zscale)
-        else:
-            return ""
+        """Flag rows with no compound crs present."""
 
-    @staticmethod
-    def __is_xoffset_invalid(xoffset: float):
-        expected = 0
-        modulo = float(xoffset) % 1
-        if modulo != expected:
-            return str(xoffset)
-        else:
-            return ""
+        empty = compd_cs.isna() | compd_cs.eq("")
 
-    @staticmethod
-    def __is_yoffset_invalid(yoffset: float):
-        expected = 0
-        modulo = float(yoffset) % 1
-        if modulo != expected:
-            return str(yoffset)
-        else:
-            return ""
+        return empty.map({True: "No compound projection", False: ""})
 
     @staticmethod
-    def __is_zoffset_invalid(zoffset: float):
-        expected = 0
-        modulo = float(zoffset) % 1
-        if modulo != expected:
-            return str(zoffset)
-        else:
-            return ""
+    def __flag_classes(classes):
 
-    @staticmethod
-    def __is_globalencoding_invalid(value: int):
-        expected = 17
-        if value != expected:
-            return str(value)
-        else:
-            return ""
+        """Flag class lists containing class code 0 (never classified)."""
 
-    @staticmethod
-    def __is_wktflag_invalid(flag: bool):
-        expected = True
-        if flag != expected:
-            return flag
-        else:
-            return ""
+        # match a standalone 0 in the "[0, 2, 5]" class list string
+        has_zero = classes.astype(str).str.contains(r'(?<![0-9])0(?![0-9])', regex=True)
 
-    @staticmethod
-    def __is_gpstimeflag_invalid(flag: bool):
-        expected = True
-        if flag != expected:
-            return flag
-        else:
-            return ""
+        return classes.where(has_zero, "")
 
     @staticmethod
-    def __is_syntheticflag_invalid(flag: bool):
-        expected = False
-        if flag != expected:
-            return flag
-        else:
-            return ""
+    def __is_sourceid_valid(row):
+        numb5 = str(row["filename"]).split("_")[0]
+        fsid = str(row["file_source_id"])
+        return "Correct" if fsid == numb5 else "Filename does not contain File Source ID"
 
-    @staticmethod
-    def __is_date_from_future(date: str):
-        today = datetime.datetime.today()
-        in_date = date.split(" ")[0]
-        ymd = in_date.split("-")
-
-        # first check if GpsWeekTimeError string is present
-        is_invalid_date = date == Laszy.GPS_WEEK_TIME_ERR_STR
-        if not is_invalid_date:  # now check the actual date
-            year, month, day = int(ymd[0]), int(ymd[1]), int(ymd[2])
-            invalid_year = today.year < year
-            invalid_month = (today.year == year) and (today.month < month)
-            invalid_day = (today.year == year) and (today.month == month) and (today.day < day)
-            is_invalid_date = invalid_day or invalid_month or invalid_year
-        if is_invalid_date:
-            return date
-        else:
-            return ""
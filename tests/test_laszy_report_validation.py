@@ -0,0 +1,112 @@
+import os
+import sys
+
+# LaszyReport imports its sibling modules flat (import Laszy), so the
+# laszy directory itself goes on the path.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "laszy"))
+
+import pandas as pd
+
+from LaszyReport import LaszyReport, LASZY_REPORT_KEEP_COLUMNS
+from LaszyReport import _LaszyReportColumns
+
+
+def _report_rows() -> tuple:
+
+    """
+    Build one fully valid and one invalid report row.
+
+    The valid row passes every deterministic column check, which is the
+    case that used to crash the dtype-coerced validation sweep: writing
+    the "" sentinel into a nullable extension column raises TypeError as
+    soon as a single cell is valid.
+
+    :return: Tuple of (valid, invalid) row dictionaries keyed by the validation columns.
+    """
+
+    valid = {
+        "filename": "092b044121_file.laz",
+        "guid_asc": "OP21BMRS001",
+        "file_source_id": 1,
+        "system_id": "RIEGL VQ580",
+        "creation_date": "2021-06-01",
+        "version": 1.4,
+        "point_data_format": 6,
+        "x_scale": 0.01,
+        "y_scale": 0.01,
+        "z_scale": 0.01,
+        "x_offset": 0.0,
+        "y_offset": 0.0,
+        "z_offset": 0.0,
+        "global_encoding": 17,
+        "gps_standard_time": True,
+        "synthetic_returns": False,
+        "wkt_crs": True,
+        "vert_datum": "Canadian Geodetic Vertical Datum of 2013",
+        "compd_cs": "COMPD_CS[...]",
+        "hz_datum": "NAD83_Canadian_Spatial_Reference_System",
+        "vlr_has_wkt_crs": True,
+        "classes": "[2, 5]",
+        "gps_time_min": 2.1e8,
+        "gps_time_max": 2.2e8,
+        "date_end": "2021-06-01 12:00:00",
+        "flightline_start": 1,
+        "flightline_end": 4,
+        "has_synthetic": False,
+        "evlr_has_wkt_crs": False,
+    }
+
+    invalid = dict(valid)
+    invalid.update({
+        "filename": "092b044122_file.laz",
+        "version": 1.2,
+        "point_data_format": 3,
+        "x_scale": 0.001,
+        "x_offset": 0.5,
+        "global_encoding": 0,
+        "wkt_crs": False,
+        "gps_standard_time": False,
+        "synthetic_returns": True,
+        "compd_cs": "",
+        "vert_datum": "CGVD28",
+        "classes": "[0, 2]",
+        "flightline_start": 0,
+        "gps_time_min": 500.0,
+        "has_synthetic": True,
+        "date_end": "2099-01-01 12:00:00",
+    })
+
+    return valid, invalid
+
+
+def test_validate_report_handles_fully_valid_rows(tmp_path):
+
+    valid, invalid = _report_rows()
+    csv_path = str(tmp_path / "laszy_report.csv")
+    pd.DataFrame([valid, invalid], columns=LASZY_REPORT_KEEP_COLUMNS).to_csv(csv_path, index=False)
+
+    report = LaszyReport(flist=[], odir=str(tmp_path))
+    report.validate_report(path=csv_path, outdir=str(tmp_path))
+
+    assert os.path.exists(str(tmp_path / "laszy_report_errors.csv"))
+    assert os.path.exists(str(tmp_path / "laszy_report_errors_summary.json"))
+
+
+def test_validate_report_from_memory(tmp_path):
+
+    valid, invalid = _report_rows()
+    rows = []
+    for row in (valid, invalid):
+        full = {column: "" for column in _LaszyReportColumns.COLUMNS}
+        full.update(row)
+        rows.append(full)
+
+    csv_path = str(tmp_path / "laszy_report.csv")
+    report = LaszyReport(flist=[], odir=str(tmp_path))
+    report._df = pd.DataFrame(rows, columns=_LaszyReportColumns.COLUMNS)
+    report._path = csv_path
+
+    report.validate_report(path=csv_path, outdir=str(tmp_path))
+
+    assert os.path.exists(str(tmp_path / "laszy_report_errors.csv"))
+    assert os.path.exists(str(tmp_path / "laszy_report_errors_summary.json"))